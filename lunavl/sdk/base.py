@@ -56,7 +56,7 @@ class Landmarks(BaseEstimation):
         _points (Optional[Tuple[Point[float]]]): lazy loaded attributes: core landmarks as point list
     """
 
-    __slots__ = ["_points", "_coreEstimation"]
+    __slots__ = ("_points",)
 
     def __init__(self, coreLandmarks: LANDMARKS):
         """
@@ -99,6 +99,8 @@ class LandmarkWithScore(BaseEstimation):
     Point with score.
     """
 
+    __slots__ = ()
+
     def __init__(self, landmark: HumanLandmark):  # pylint: disable=C0103
         """
         Init
@@ -153,7 +155,7 @@ class LandmarksWithScore(BaseEstimation):
         _points (Optional[Tuple[Point[float]]]): lazy load attributes, converted to point list core landmarks
     """
 
-    __slots__ = ["_points", "_coreEstimation"]
+    __slots__ = ("_points",)
 
     def __init__(self, coreLandmarks: HumanLandmarks17):
         """
@@ -198,6 +200,8 @@ class BoundingBox(BaseEstimation):
                          and not the source image quality. It may be used topick the most "*confident*" face of many.
     """
 
+    __slots__ = ()
+
     #  pylint: disable=W0235
     def __init__(self, boundingBox: DetectionFloat):
         """
@@ -39,6 +39,8 @@ class Landmarks5(Landmarks):
     Landmarks5
     """
 
+    __slots__ = ()
+
     #  pylint: disable=W0235
     def __init__(self, coreLandmark5: CoreLandmarks5):
         """
@@ -55,6 +57,8 @@ class Landmarks68(Landmarks):
     Landmarks68
     """
 
+    __slots__ = ()
+
     #  pylint: disable=W0235
     def __init__(self, coreLandmark68: CoreLandmarks68):
         """
@@ -42,6 +42,8 @@ class Landmarks17(LandmarksWithScore):
     Landmarks17
     """
 
+    __slots__ = ()
+
     #  pylint: disable=W0235
     def __init__(self, coreLandmark17: CoreLandmarks17):
         """
@@ -52,6 +52,8 @@ class IrisLandmarks(Landmarks):
      Eyelid landmarks.
     """
 
+    __slots__ = ()
+
     #  pylint: disable=W0235
     def __init__(self, coreIrisLandmarks: CoreIrisLandmarks):
         """
@@ -68,6 +70,8 @@ class EyelidLandmarks(Landmarks):
      Eyelid landmarks.
     """
 
+    __slots__ = ()
+
     #  pylint: disable=W0235
     def __init__(self, coreEyelidLandmarks: CoreEyelidLandmarks):
         """
@@ -4,12 +4,13 @@ SDK configuration module.
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Union, Optional, Tuple, Any, TypeVar, Type
+from typing import Union, Optional, Tuple, Any, TypeVar, Type, Dict
 
 import FaceEngine as CoreFE
 from FaceEngine import ObjectDetectorClassType, PyISettingsProvider  # pylint: disable=E0611,E0401
 
 BI_ENUM = TypeVar("BI_ENUM", bound="BiDirectionEnum")
+SETTINGS_SECTION = TypeVar("SETTINGS_SECTION", bound="BaseSettingsSection")
 
 
 class BiDirectionEnum(Enum):
@@ -30,10 +31,10 @@ class BiDirectionEnum(Enum):
         Raises:
               KeyError: if element not found.
         """
-        for enumMember in cls:
-            if enumMember.value == enumValue:
-                return enumMember
-        raise KeyError("Enum {} does not contain  member with value {}".format(cls.__name__, enumValue))
+        enumMember = cls._value2member_map_.get(enumValue)  # type: ignore
+        if enumMember is None:
+            raise KeyError("Enum {} does not contain  member with value {}".format(cls.__name__, enumValue))
+        return enumMember
 
 
 class CpuClass(Enum):
@@ -193,6 +194,8 @@ class BaseSettingsSection:
         _coreSettingProvider (PyISettingsProvider): core settings faceEngineProvider
     """
 
+    __slots__ = ("_coreSettingProvider",)
+
     # (str): section name
     sectionName: str
 
@@ -264,6 +267,8 @@ class SystemSettings(BaseSettingsSection):
         - defaultDetectorType (DetectorType): default detector type
     """
 
+    __slots__ = ()
+
     sectionName = "system"
 
     @property
@@ -279,7 +284,7 @@ class SystemSettings(BaseSettingsSection):
     @verboseLogging.setter
     def verboseLogging(self, value: VerboseLogging) -> None:
         """
-        Setter for cpuClass.
+        Setter for verboseLogging.
 
         Args:
             value: new value
@@ -311,7 +316,7 @@ class SystemSettings(BaseSettingsSection):
         Getter for defaultDetectorType
 
         Returns:
-            betaMode
+            defaultDetectorType
         """
         return DetectorType.getEnum(self.getValueAsString("defaultDetectorType"))
 
@@ -342,6 +347,8 @@ class RuntimeSettings(BaseSettingsSection):
         numComputeStreams (int):  increases performance, but works only with new versions of nvidia drivers
     """
 
+    __slots__ = ()
+
     sectionName = "Runtime"
 
     @property
@@ -456,6 +463,8 @@ class DescriptorFactorySettings(BaseSettingsSection):
 
     """
 
+    __slots__ = ()
+
     sectionName = "DescriptorFactory::Settings"
 
     @property
@@ -555,6 +564,8 @@ class FaceDetV3Settings(BaseSettingsSection):
         - useOrientationMode (bool): use mode for rotated origin images or not;
     """
 
+    __slots__ = ()
+
     sectionName = "FaceDetV3::Settings"
 
     @property
@@ -570,7 +581,7 @@ class FaceDetV3Settings(BaseSettingsSection):
     @scoreThreshold.setter
     def scoreThreshold(self, value: float) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for scoreThreshold
         Args:
             value: new value
         """
@@ -772,7 +783,7 @@ class FaceDetV3Settings(BaseSettingsSection):
         Getter for useOrientationMode
 
         Returns:
-            useEstimationByImage
+            useOrientationMode
         """
         return bool(self.getValueAsInt("useOrientationMode"))
 
@@ -801,6 +812,8 @@ class FaceDetV12Settings(BaseSettingsSection):
         - redetectTolerance (float): redetect tolerance;
     """
 
+    __slots__ = ()
+
     @property
     def firstThreshold(self) -> float:
         """
@@ -864,7 +877,7 @@ class FaceDetV12Settings(BaseSettingsSection):
         Getter for minFaceSize
 
         Returns:
-            minSize
+            minFaceSize
         """
         return self.getValueAsInt("minFaceSize")
 
@@ -890,7 +903,7 @@ class FaceDetV12Settings(BaseSettingsSection):
     @scaleFactor.setter
     def scaleFactor(self, value: float) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for scaleFactor
         Args:
             value: new value
         """
@@ -909,7 +922,7 @@ class FaceDetV12Settings(BaseSettingsSection):
     @paddings.setter
     def paddings(self, value: Point4) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for paddings
         Args:
             value: new value
         """
@@ -928,7 +941,7 @@ class FaceDetV12Settings(BaseSettingsSection):
     @redetectTolerance.setter
     def redetectTolerance(self, value: float) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for redetectTolerance
         Args:
             value: new value
         """
@@ -940,7 +953,7 @@ class FaceDetV12Settings(BaseSettingsSection):
         Getter for useLNet
 
         Returns:
-            useEstimationByImage
+            useLNet
         """
         return bool(self.getValueAsInt("useLNet"))
 
@@ -959,6 +972,8 @@ class FaceDetV1Settings(FaceDetV12Settings):
     FaceDetV1 settings.
     """
 
+    __slots__ = ()
+
     sectionName = "FaceDetV1::Settings"
 
 
@@ -967,6 +982,8 @@ class FaceDetV2Settings(FaceDetV12Settings):
     FaceDetV2 settings.
     """
 
+    __slots__ = ()
+
     sectionName = "FaceDetV2::Settings"
 
 
@@ -985,6 +1002,8 @@ class HumanDetectorSettings(BaseSettingsSection):
         - landmarks17Threshold (float): body landmarks threshold in [0..1] range;
     """
 
+    __slots__ = ()
+
     sectionName = "HumanDetector::Settings"
 
     @property
@@ -1000,7 +1019,7 @@ class HumanDetectorSettings(BaseSettingsSection):
     @scoreThreshold.setter
     def scoreThreshold(self, value: float) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for scoreThreshold
         Args:
             value: new value
         """
@@ -1104,10 +1123,10 @@ class HumanDetectorSettings(BaseSettingsSection):
     @property
     def redetectNMS(self) -> NMS:
         """
-        Getter for redetectMms
+        Getter for redetectNMS
 
         Returns:
-            nms
+            redetectNMS
         """
         return NMS[self.getValueAsString("RedetectNMS")]
 
@@ -1126,7 +1145,7 @@ class HumanDetectorSettings(BaseSettingsSection):
         Getter for landmarks17Threshold
 
         Returns:
-            scoreThreshold
+            landmarks17Threshold
         """
         return self.getValueAsFloat("landmarks17Threshold")
 
@@ -1153,6 +1172,8 @@ class LNetBaseSettings(BaseSettingsSection):
 
     """
 
+    __slots__ = ()
+
     @property
     def planName(self) -> str:
         """
@@ -1233,18 +1254,24 @@ class LNetBaseSettings(BaseSettingsSection):
 class LNetSettings(LNetBaseSettings):
     """LNet configuration section"""
 
+    __slots__ = ()
+
     sectionName = "LNet::Settings"
 
 
 class LNetIRSettings(LNetBaseSettings):
     """LNetIR configuration section"""
 
+    __slots__ = ()
+
     sectionName = "LNetIR::Settings"
 
 
 class SLNetSettings(LNetBaseSettings):
     """SLNet configuration section"""
 
+    __slots__ = ()
+
     sectionName = "SLNet::Settings"
 
 
@@ -1262,6 +1289,8 @@ class QualityEstimatorSettings(BaseSettingsSection):
         - platt (Point2): coefficient platt
     """
 
+    __slots__ = ()
+
     sectionName = "QualityEstimator::Settings"
 
     @property
@@ -1315,7 +1344,7 @@ class QualityEstimatorSettings(BaseSettingsSection):
     @expDark.setter
     def expDark(self, value: Point3) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for expDark
         Args:
             value: new expDark
         """
@@ -1388,6 +1417,8 @@ class HeadPoseEstimatorSettings(BaseSettingsSection):
         - useEstimationByLandmarks (bool): use head pose estimation by landmarks
     """
 
+    __slots__ = ()
+
     sectionName = "HeadPoseEstimator::Settings"
 
     @property
@@ -1437,6 +1468,8 @@ class EyeEstimatorSettings(BaseSettingsSection):
         - useStatusPlan (bool): use  status plan or not.
     """
 
+    __slots__ = ()
+
     sectionName = "EyeEstimator::Settings"
 
     @property
@@ -1467,6 +1500,8 @@ class BestShotQualityEstimatorSettings(BaseSettingsSection):
         - runSubestimatorsConcurrently (int): run sub estimators concurrently
     """
 
+    __slots__ = ()
+
     sectionName = "BestShotQualityEstimator::Settings"
 
     @property
@@ -1475,7 +1510,7 @@ class BestShotQualityEstimatorSettings(BaseSettingsSection):
         Getter for runSubestimatorsConcurrently
 
         Returns:
-            useStatusPlan
+            runSubestimatorsConcurrently
         """
         return self.getValueAsInt("runSubestimatorsConcurrently")
 
@@ -1498,6 +1533,8 @@ class AttributeEstimatorSettings(BaseSettingsSection):
         - adultThreshold (float): adult threshold in [0..1] range
     """
 
+    __slots__ = ()
+
     sectionName = "AttributeEstimator::Settings"
 
     @property
@@ -1549,6 +1586,8 @@ class GlassesEstimatorSettings(BaseSettingsSection):
         - sunGlassesThreshold (float): sun glasses threshold in [0..1] range
     """
 
+    __slots__ = ()
+
     sectionName = "GlassesEstimator::Settings"
 
     @property
@@ -1617,6 +1656,8 @@ class OverlapEstimatorSettings(BaseSettingsSection):
         - overlapThreshold (float): overlap threshold for any object in [0..1] range
     """
 
+    __slots__ = ()
+
     sectionName = "OverlapEstimator::Settings"
 
     @property
@@ -1647,6 +1688,8 @@ class ChildEstimatorSettings(BaseSettingsSection):
         - childThreshold (float):  if estimate value less than threshold object is a children.
     """
 
+    __slots__ = ()
+
     sectionName = "ChildEstimator::Settings"
 
     @property
@@ -1679,6 +1722,8 @@ class LivenessIREstimatorSettings(BaseSettingsSection):
         - irNonCooperativeThreshold (float): liveness threshold for non cooperative mode in [0..1] range
     """
 
+    __slots__ = ()
+
     sectionName = "LivenessIREstimator::Settings"
 
     @property
@@ -1749,6 +1794,8 @@ class MaskEstimatorSettings(BaseSettingsSection):
         - occludedThreshold (float): occluded mask state threshold in [0..1] range
     """
 
+    __slots__ = ()
+
     sectionName = "MedicalMaskEstimator::Settings"
 
     @property
@@ -1819,6 +1866,8 @@ class MouthEstimatorSettings(BaseSettingsSection):
         - openThreshold (float): open mouth threshold in [0..1] range
     """
 
+    __slots__ = ()
+
     sectionName = "MouthEstimator::Settings"
 
     @property
@@ -1834,7 +1883,7 @@ class MouthEstimatorSettings(BaseSettingsSection):
     @occlusionThreshold.setter
     def occlusionThreshold(self, value: float) -> None:
         """
-        Setter for medicalMaskThreshold
+        Setter for occlusionThreshold
         Args:
             value: new value
         """
@@ -1872,7 +1921,7 @@ class MouthEstimatorSettings(BaseSettingsSection):
     @openThreshold.setter
     def openThreshold(self, value: float) -> None:
         """
-        Setter for occludedThreshold
+        Setter for openThreshold
         Args:
             value: new value
         """
@@ -1890,22 +1939,24 @@ class HeadAndShouldersLivenessEstimatorSettings(BaseSettingsSection):
         - headHeightKoeff (float): headHeightKoeff
     """
 
+    __slots__ = ()
+
     sectionName = "HeadAndShouldersLivenessEstimator::Settings"
 
     @property
     def headWidthKoeff(self) -> float:
         """
-        Getter for betaMode
+        Getter for headWidthKoeff
 
         Returns:
-            betaMode
+            headWidthKoeff
         """
         return self.getValueAsFloat("headWidthKoeff")
 
     @headWidthKoeff.setter
     def headWidthKoeff(self, value: float) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for headWidthKoeff
         Args:
             value: new value
         """
@@ -1914,17 +1965,17 @@ class HeadAndShouldersLivenessEstimatorSettings(BaseSettingsSection):
     @property
     def headHeightKoeff(self) -> float:
         """
-        Getter for betaMode
+        Getter for headHeightKoeff
 
         Returns:
-            betaMode
+            headHeightKoeff
         """
         return self.getValueAsFloat("headHeightKoeff")
 
     @headHeightKoeff.setter
     def headHeightKoeff(self, value: float) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for headHeightKoeff
         Args:
             value: new value
         """
@@ -1933,17 +1984,17 @@ class HeadAndShouldersLivenessEstimatorSettings(BaseSettingsSection):
     @property
     def shouldersWidthKoeff(self) -> float:
         """
-        Getter for betaMode
+        Getter for shouldersWidthKoeff
 
         Returns:
-            betaMode
+            shouldersWidthKoeff
         """
         return self.getValueAsFloat("shouldersWidthKoeff")
 
     @shouldersWidthKoeff.setter
     def shouldersWidthKoeff(self, value: float) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for shouldersWidthKoeff
         Args:
             value: new value
         """
@@ -1952,17 +2003,17 @@ class HeadAndShouldersLivenessEstimatorSettings(BaseSettingsSection):
     @property
     def shouldersHeightKoeff(self) -> float:
         """
-        Getter for betaMode
+        Getter for shouldersHeightKoeff
 
         Returns:
-            betaMode
+            shouldersHeightKoeff
         """
         return self.getValueAsFloat("shouldersHeightKoeff")
 
     @shouldersHeightKoeff.setter
     def shouldersHeightKoeff(self, value: float) -> None:
         """
-        Setter for descriptorCountWarningLevel
+        Setter for shouldersHeightKoeff
         Args:
             value: new value
         """
@@ -1979,6 +2030,7 @@ class BaseSettingsProvider:
         pathToConfig (str): path to a configuration file. Config file is getting from
                           the folder'data'  in "FSDK_ROOT".
         _coreSettingProvider (PyISettingsProvider): core settings provider
+        _sections (Dict[Type[BaseSettingsSection], BaseSettingsSection]): already created settings sections
     """
 
     # default configuration filename.
@@ -2009,6 +2061,23 @@ class BaseSettingsProvider:
         # todo: check existance
 
         self._coreSettingProvider = CoreFE.createSettingsProvider(str(self.pathToConfig))
+        self._sections: Dict[Type[BaseSettingsSection], BaseSettingsSection] = {}
+
+    def _getSection(self, sectionClass: Type[SETTINGS_SECTION]) -> SETTINGS_SECTION:
+        """
+        Get a settings section. A section is a stateless proxy to the core provider, so it is created once
+        and reused on next accesses.
+
+        Args:
+            sectionClass: section class
+
+        Returns:
+            section
+        """
+        section = self._sections.get(sectionClass)
+        if section is None:
+            section = self._sections[sectionClass] = sectionClass(self._coreSettingProvider)
+        return section  # type: ignore
 
     @property
     def coreProvider(self) -> PyISettingsProvider:
@@ -2038,7 +2107,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable system section
         """
-        return SystemSettings(self._coreSettingProvider)
+        return self._getSection(SystemSettings)
 
     @property
     def descriptorFactorySettings(self) -> DescriptorFactorySettings:
@@ -2048,7 +2117,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable descriptor factory section
         """
-        return DescriptorFactorySettings(self._coreSettingProvider)
+        return self._getSection(DescriptorFactorySettings)
 
     @property
     def faceDetV3Settings(self) -> FaceDetV3Settings:
@@ -2058,7 +2127,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable FaceDetV3 section
         """
-        return FaceDetV3Settings(self._coreSettingProvider)
+        return self._getSection(FaceDetV3Settings)
 
     @property
     def faceDetV1Settings(self) -> FaceDetV1Settings:
@@ -2068,7 +2137,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable FaceDetV1 section
         """
-        return FaceDetV1Settings(self._coreSettingProvider)
+        return self._getSection(FaceDetV1Settings)
 
     @property
     def faceDetV2Settings(self) -> FaceDetV2Settings:
@@ -2078,7 +2147,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable FaceDetV2 section
         """
-        return FaceDetV2Settings(self._coreSettingProvider)
+        return self._getSection(FaceDetV2Settings)
 
     @property
     def humanDetectorSettings(self) -> HumanDetectorSettings:
@@ -2088,7 +2157,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable HumanDetectorSettings section
         """
-        return HumanDetectorSettings(self._coreSettingProvider)
+        return self._getSection(HumanDetectorSettings)
 
     @property
     def lNetSettings(self) -> LNetSettings:
@@ -2098,7 +2167,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable LNet section
         """
-        return LNetSettings(self._coreSettingProvider)
+        return self._getSection(LNetSettings)
 
     @property
     def lNetIRSettings(self) -> LNetIRSettings:
@@ -2108,7 +2177,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable LNetIR section
         """
-        return LNetIRSettings(self._coreSettingProvider)
+        return self._getSection(LNetIRSettings)
 
     @property
     def slNetSettings(self) -> SLNetSettings:
@@ -2118,7 +2187,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable SLNet section
         """
-        return SLNetSettings(self._coreSettingProvider)
+        return self._getSection(SLNetSettings)
 
     @property
     def qualityEstimatorSettings(self) -> QualityEstimatorSettings:
@@ -2128,7 +2197,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable QualityEstimator section
         """
-        return QualityEstimatorSettings(self._coreSettingProvider)
+        return self._getSection(QualityEstimatorSettings)
 
     @property
     def headPoseEstimatorSettings(self) -> HeadPoseEstimatorSettings:
@@ -2138,7 +2207,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable HeadPoseEstimator section
         """
-        return HeadPoseEstimatorSettings(self._coreSettingProvider)
+        return self._getSection(HeadPoseEstimatorSettings)
 
     @property
     def eyeEstimatorSettings(self) -> EyeEstimatorSettings:
@@ -2148,7 +2217,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable EyeEstimator section
         """
-        return EyeEstimatorSettings(self._coreSettingProvider)
+        return self._getSection(EyeEstimatorSettings)
 
     @property
     def attributeEstimatorSettings(self) -> AttributeEstimatorSettings:
@@ -2158,7 +2227,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable AttributeEstimator section
         """
-        return AttributeEstimatorSettings(self._coreSettingProvider)
+        return self._getSection(AttributeEstimatorSettings)
 
     @property
     def glassesEstimatorSettings(self) -> GlassesEstimatorSettings:
@@ -2168,7 +2237,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable GlassesEstimator section
         """
-        return GlassesEstimatorSettings(self._coreSettingProvider)
+        return self._getSection(GlassesEstimatorSettings)
 
     @property
     def overlapEstimatorSettings(self) -> OverlapEstimatorSettings:
@@ -2178,7 +2247,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable OverlapEstimator section
         """
-        return OverlapEstimatorSettings(self._coreSettingProvider)
+        return self._getSection(OverlapEstimatorSettings)
 
     @property
     def childEstimatorSettings(self) -> ChildEstimatorSettings:
@@ -2188,7 +2257,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable ChildEstimator section
         """
-        return ChildEstimatorSettings(self._coreSettingProvider)
+        return self._getSection(ChildEstimatorSettings)
 
     @property
     def livenessIREstimatorSettings(self) -> LivenessIREstimatorSettings:
@@ -2198,7 +2267,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable LivenessIREstimator section
         """
-        return LivenessIREstimatorSettings(self._coreSettingProvider)
+        return self._getSection(LivenessIREstimatorSettings)
 
     @property
     def headAndShouldersLivenessEstimatorSettings(self) -> HeadAndShouldersLivenessEstimatorSettings:
@@ -2208,7 +2277,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable HeadAndShouldersLivenessEstimator section
         """
-        return HeadAndShouldersLivenessEstimatorSettings(self._coreSettingProvider)
+        return self._getSection(HeadAndShouldersLivenessEstimatorSettings)
 
     @property
     def bestShotQualityEstimator(self) -> BestShotQualityEstimatorSettings:
@@ -2218,7 +2287,7 @@ class FaceEngineSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable BestShotQualityEstimatorSettings section
         """
-        return BestShotQualityEstimatorSettings(self._coreSettingProvider)
+        return self._getSection(BestShotQualityEstimatorSettings)
 
 
 class RuntimeSettingsProvider(BaseSettingsProvider):
@@ -2238,4 +2307,4 @@ class RuntimeSettingsProvider(BaseSettingsProvider):
         Returns:
             Mutable runtime section
         """
-        return RuntimeSettings(self._coreSettingProvider)
+        return self._getSection(RuntimeSettings)
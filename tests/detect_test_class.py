@@ -3,6 +3,8 @@ from typing import List, Union, Type
 
 import itertools
 
+import numpy as np
+
 from lunavl.sdk.base import BoundingBox, LandmarkWithScore
 from lunavl.sdk.detectors.base import BaseDetection
 from lunavl.sdk.detectors.facedetector import FaceDetection, FaceDetector, Landmarks5, Landmarks68
@@ -24,6 +26,9 @@ AREA_WITHOUT_FACE = Rect(50, 50, 100, 100)
 INVALID_RECT = Rect(0, 0, 0, 0)
 ERROR_CORE_RECT = Rect(0.1, 0.1, 0.1, 0.1)  # anything out of range (0.1, 1)
 
+HumanCaseLandmarks = namedtuple("HumanCaseLandmarks", ("detectLandmarks",))
+CaseLandmarks = namedtuple("CaseLandmarks", ("detect5Landmarks", "detect68Landmarks"))
+
 
 class BaseDetectorTestClass(BaseTestClass):
     """
@@ -77,7 +82,9 @@ class BaseDetectorTestClass(BaseTestClass):
             assert isinstance(detection, self.__class__.detectionClass), (
                 f"{detection.__class__} is not " f"{self.__class__.detectionClass}"
             )
-            assert detection.image.asPillow() == imageVl.asPillow(), "Detection image does not match VLImage"
+            assert np.array_equal(
+                detection.image.asNPArray(), imageVl.asNPArray()
+            ), "Detection image does not match VLImage"
             self.assertBoundingBox(detection.boundingBox)
 
 
@@ -97,8 +104,7 @@ class HumanDetectTestClass(BaseDetectorTestClass):
         """
         super().setup_class()
         cls.detector = cls.faceEngine.createHumanDetector()
-        CaseLandmarks = namedtuple("CaseLandmarks", ("detectLandmarks"))
-        cls.landmarksCases = [CaseLandmarks(True), CaseLandmarks(False)]
+        cls.landmarksCases = [HumanCaseLandmarks(True), HumanCaseLandmarks(False)]
 
     def assertHumanDetection(self, detection: Union[HumanDetection, List[HumanDetection]], imageVl: VLImage):
         """
@@ -155,7 +161,6 @@ class FaceDetectTestClass(BaseDetectorTestClass):
             cls.faceEngine.createFaceDetector(DetectorType.FACE_DET_V2),
             cls.faceEngine.createFaceDetector(DetectorType.FACE_DET_V3),
         ]
-        CaseLandmarks = namedtuple("CaseLandmarks", ("detect5Landmarks", "detect68Landmarks"))
         cls.landmarksCases = [
             CaseLandmarks(landmarks5, landmarks68)
             for landmarks5, landmarks68 in itertools.product((True, False), (True, False))
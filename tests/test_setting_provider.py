@@ -0,0 +1,44 @@
+import pytest
+
+from lunavl.sdk.faceengine.setting_provider import (
+    FaceEngineSettingsProvider,
+    RuntimeSettingsProvider,
+    SystemSettings,
+    FaceDetV3Settings,
+)
+from tests.base import BaseTestClass
+
+
+class TestSettingsProvider(BaseTestClass):
+    """
+    Test settings providers sections
+    """
+
+    def test_section_is_reused(self):
+        """
+        Test repeated access to a section returns the same section
+        """
+        provider = FaceEngineSettingsProvider()
+        for sectionName in ("systemSettings", "faceDetV3Settings"):
+            with self.subTest(section=sectionName):
+                assert getattr(provider, sectionName) is getattr(provider, sectionName)
+        runtimeProvider = RuntimeSettingsProvider()
+        assert runtimeProvider.runtimeSettings is runtimeProvider.runtimeSettings
+
+    def test_section_is_not_shared_between_providers(self):
+        """
+        Test two providers never share a section
+        """
+        provider1 = FaceEngineSettingsProvider()
+        provider2 = FaceEngineSettingsProvider()
+        assert isinstance(provider1.systemSettings, SystemSettings)
+        assert provider1.systemSettings is not provider2.systemSettings
+        assert provider1.faceDetV3Settings is not provider2.faceDetV3Settings
+
+    def test_section_is_read_only(self):
+        """
+        Test a section of a provider can not be replaced
+        """
+        provider = FaceEngineSettingsProvider()
+        with pytest.raises(AttributeError):
+            provider.faceDetV3Settings = FaceDetV3Settings(provider.coreProvider)